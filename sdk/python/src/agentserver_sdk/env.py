@@ -6,6 +6,7 @@ import base64
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
 
 from .errors import ToolError
 from .types import ShellResult, ToolMetadata
@@ -23,9 +24,13 @@ class Env:
     tools: list[ToolMetadata]
     _client: HTTPClient  # type: ignore[assignment]  # C2 will wire REST calls
     _tool_index: dict[str, ToolMetadata] = field(init=False)
+    _call_path: str = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         self._tool_index = {t.name: t for t in self.tools}
+        # Every tool call (typed wrappers, dynamic tools, Process) posts here;
+        # quote the env name once instead of per call.
+        self._call_path = f"/api/sdk/envs/{quote(self.name)}/tool/call"
         for tool in self.tools:
             if tool.kind == "core":
                 continue  # core tools have typed wrappers
@@ -55,13 +60,9 @@ class Env:
         `environment_id` is injected automatically. Raises ToolError on
         isError=true. Returns the raw MCP result dict.
         """
-        from urllib.parse import quote
         args = dict(arguments or {})
         args.setdefault("environment_id", self.name)
-        raw = await self._client.post(
-            f"/api/sdk/envs/{quote(self.name)}/tool/call",
-            {"tool": tool, "arguments": args},
-        )
+        raw = await self._client.post(self._call_path, {"tool": tool, "arguments": args})
         if raw.get("isError"):
             msg = _extract_error_text(raw)
             raise ToolError(tool=tool, env=self.name, message=msg, raw=raw)
@@ -27,13 +27,16 @@ class Process:
         if not sid:
             # exec_command's text content carries the session_id when the
             # gateway didn't populate structuredContent (older response shape).
+            # Only a JSON object can carry it; plain-text output ("started")
+            # skips the speculative parse.
             content = raw.get("content") or []
             if content and content[0].get("type") == "text":
-                try:
-                    body = _json.loads(content[0]["text"])
-                    sid = body.get("session_id")
-                except Exception:
-                    sid = None
+                text = content[0].get("text") or ""
+                if text.lstrip().startswith("{"):
+                    try:
+                        sid = _json.loads(text).get("session_id")
+                    except ValueError:
+                        sid = None
         if not sid:
             raise ToolError(
                 tool="exec_command",
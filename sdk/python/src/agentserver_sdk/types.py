@@ -25,7 +25,7 @@ CORE_TOOLS = frozenset(
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ShellResult:
     stdout: str
     stderr: str
@@ -64,7 +64,7 @@ class ShellResult:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolMetadata:
     name: str
     description: str
@@ -82,7 +82,7 @@ class ToolMetadata:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class OperationRecord:
     id: str
     env_id: str
@@ -36,6 +36,24 @@ async def test_call_injects_environment_id(stub_client):
     await env.call("shell", {"command": ["ls"]})
 
 
+async def test_call_quotes_env_name_in_path(stub_client):
+    client, stub = stub_client
+    raw_paths: list[bytes] = []
+
+    async def tool(body, query):
+        return 200, {"isError": False, "content": []}
+
+    async def record(request):
+        raw_paths.append(request.url.raw_path)
+
+    stub.register("POST", "/api/sdk/envs/gpu?1/tool/call", tool)
+    client._http.event_hooks["request"] = [record]
+    env = make_env(client, name="gpu?1")
+    await env.call("read_file", {"path": "/a"})
+    await env.call("read_file", {"path": "/b"})
+    assert raw_paths == [b"/api/sdk/envs/gpu%3F1/tool/call"] * 2
+
+
 async def test_shell_str_wraps_as_single_argv(stub_client):
     """A bare-string command must be sent as ["cmd"] — not the string itself —
     so the server's argv contract holds. Multi-token strings are the caller's
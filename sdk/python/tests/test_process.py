@@ -52,6 +52,41 @@ async def test_spawn_calls_exec_command_and_sets_session_id(stub_client):
     assert terminated == [True]
 
 
+async def test_spawn_reads_session_id_from_text_content(stub_client):
+    client, stub = stub_client
+
+    async def exec_cmd(body, query):
+        return 200, {
+            "isError": False,
+            "content": [{"type": "text", "text": '{"session_id": "sid-t"}'}],
+        }
+
+    async def terminate(body, query):
+        return 200, {"ok": True}
+
+    stub.register("POST", "/api/sdk/envs/my-mac/tool/call", exec_cmd)
+    stub.register("POST", "/api/sdk/processes/sid-t/terminate", terminate)
+
+    env = make_env(client)
+    async with env.spawn("./run.sh") as proc:
+        assert proc.session_id == "sid-t"
+
+
+async def test_spawn_without_session_id_raises(stub_client):
+    client, stub = stub_client
+
+    async def exec_cmd(body, query):
+        return 200, {"isError": False, "content": [{"type": "text", "text": "started"}]}
+
+    stub.register("POST", "/api/sdk/envs/my-mac/tool/call", exec_cmd)
+
+    env = make_env(client)
+    with pytest.raises(ToolError) as ei:
+        async with env.spawn("./run.sh"):
+            pass
+    assert ei.value.tool == "exec_command"
+
+
 async def test_process_write_stdin(stub_client):
     client, stub = stub_client
     stdin_payload: list[str] = []
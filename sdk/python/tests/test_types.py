@@ -82,3 +82,11 @@ def test_operation_record_from_dict_minimal():
     assert o.duration_ms == 0
     assert o.source == ""
     assert o.started_at == ""
+
+
+def test_result_types_are_slotted():
+    """One instance per tool call / listing entry — no per-instance __dict__."""
+    r = ShellResult(stdout="", stderr="", exit_code=0)
+    m = ToolMetadata(name="shell", description="", input_schema={}, kind="core")
+    assert not hasattr(r, "__dict__")
+    assert not hasattr(m, "__dict__")